@@ -0,0 +1,88 @@
+# cython: language_level=3
+# Optionele C-versneller voor access2csv.
+#
+# Bouw lokaal met:
+#     pip install cython
+#     cythonize -i _csvfast.pyx
+#
+# access2csv gebruikt deze module alleen met --fast en valt automatisch
+# terug op het pure-Python bytes-pad als ze niet gebouwd is.
+
+from libc.stdint cimport uint64_t
+from libc.string cimport memcpy
+
+DEF ONES = 0x0101010101010101
+DEF HIGH = 0x8080808080808080
+
+
+cdef inline uint64_t has_byte(uint64_t v, uint64_t mask):
+    # Klassieke SWAR-truc: hoog bit gezet waar een byte gelijk is aan mask
+    cdef uint64_t x = v ^ mask
+    return (x - <uint64_t> ONES) & ~x & <uint64_t> HIGH
+
+
+cdef bint needs_quote(const unsigned char *p, Py_ssize_t n, unsigned char delim):
+    # Scan op delimiter, quote, \n en \r — 8 bytes per iteratie (SWAR),
+    # met een scalaire lus voor de staart
+    cdef uint64_t v
+    cdef uint64_t dmask = delim * <uint64_t> ONES
+    cdef uint64_t qmask = 34 * <uint64_t> ONES
+    cdef uint64_t nmask = 10 * <uint64_t> ONES
+    cdef uint64_t rmask = 13 * <uint64_t> ONES
+    cdef Py_ssize_t i = 0
+    cdef unsigned char c
+    while i + 8 <= n:
+        memcpy(&v, p + i, 8)
+        if has_byte(v, dmask) | has_byte(v, qmask) | has_byte(v, nmask) | has_byte(v, rmask):
+            return True
+        i += 8
+    while i < n:
+        c = p[i]
+        if c == delim or c == 34 or c == 10 or c == 13:
+            return True
+        i += 1
+    return False
+
+
+def rows_to_csv_bytes(rows, bytes delimiter, bytes lineterminator, str encoding):
+    """Formatteer één fetchmany-batch naar CSV-bytes.
+
+    rows: iterabele van pyodbc.Row (of tuples); delimiter is één byte.
+    """
+    cdef bytearray out = bytearray()
+    cdef bint first
+    cdef bytes b
+    cdef unsigned char d = delimiter[0]
+    cdef Py_ssize_t nfields, row_start
+    for row in rows:
+        first = True
+        nfields = 0
+        row_start = len(out)
+        for v in row:
+            nfields += 1
+            if first:
+                first = False
+            else:
+                out += delimiter
+            if v is None:
+                continue
+            if type(v) is int or type(v) is float:
+                # Getallen bevatten nooit te quoten tekens
+                out += str(v).encode("ascii")
+                continue
+            if type(v) is str:
+                b = (<str> v).encode(encoding)
+            else:
+                b = str(v).encode(encoding)
+            if needs_quote(b, len(b), d):
+                out += b'"'
+                out += b.replace(b'"', b'""')
+                out += b'"'
+            else:
+                out += b
+        if nfields == 1 and len(out) == row_start:
+            # Eén leeg veld moet als "" geschreven worden (zoals csv.writer),
+            # anders wordt de regel leeg en niet meer als record gelezen
+            out += b'""'
+        out += lineterminator
+    return bytes(out)
@@ -1,8 +1,15 @@
 import argparse
+import codecs
 import csv
+import datetime
+import functools
+import mmap
 import os
 import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from decimal import Decimal
 from typing import Iterable, List, Tuple, Optional
 
 try:
@@ -11,38 +18,164 @@ except ImportError:
     print("pyodbc niet geïnstalleerd. Installeer ajb met: pip install pyodbc", file=sys.stderr)
     sys.exit(2)
 
+try:
+    # Optionele C-versneller (zie _csvfast.pyx); alleen gebruikt met --fast
+    import _csvfast
+except ImportError:
+    _csvfast = None
+
+try:
+    # Optioneel (pip install liburing); alleen gebruikt met --iouring
+    import liburing
+except ImportError:
+    liburing = None
+
+try:
+    # Optioneel (pip install turbodbc numpy); alleen gebruikt met --turbodbc
+    import numpy
+    import turbodbc
+except ImportError:
+    numpy = None
+    turbodbc = None
+
 VERSION = "1.0.0"
 
+LOG_LOCK = threading.Lock()
+
 def log(msg: str, quiet: bool = False):
     if not quiet:
-        print(msg)
+        with LOG_LOCK:
+            print(msg)
+
+# Eén keer compileren; scheelt regex-cache-lookups bij duizenden tabellen
+SANITIZE_RE = re.compile(r'[\\/:"*?<>|]+')
 
 def sanitize_filename(name: str) -> str:
     # Vervang ongeldige tekens en trim
-    name = re.sub(r'[\\/:"*?<>|]+', "_", name)
+    name = SANITIZE_RE.sub("_", name)
     name = name.strip().strip(".")
     return name or "untitled"
 
+# Codecs waarbij delimiter/quote/newline als enkele ASCII-bytes coderen,
+# zodat we veilig direct op bytes kunnen werken
+BYTES_SAFE_ENCODINGS = {"utf-8", "ascii", "iso8859-1", "cp1252"}
+
+def bytes_path_supported(delimiter: str, encoding: str) -> bool:
+    # Bytes-pad alleen bij ASCII-compatibele codec en 1-teken delimiter
+    try:
+        codec = codecs.lookup(encoding).name
+    except LookupError:
+        return False
+    return codec in BYTES_SAFE_ENCODINGS and len(delimiter) == 1 and ord(delimiter) < 128
+
+def make_field_encoder(delimiter: str, encoding: str):
+    # Encoder voor het bytes-pad: str(v).encode alleen waar nodig,
+    # quoten alleen als het veld delimiter/quote/newline bevat
+    special = re.compile(("[" + re.escape(delimiter) + '"\n\r]').encode(encoding))
+    search = special.search
+
+    def encode_field(value) -> bytes:
+        if value is None:
+            return b""
+        s = value if isinstance(value, str) else str(value)
+        b = s.encode(encoding)
+        if search(b):
+            return b'"' + b.replace(b'"', b'""') + b'"'
+        return b
+
+    return encode_field
+
+def plain_field(value) -> bytes:
+    # Voor kolomtypes die nooit quoting nodig hebben (getallen e.d.)
+    if value is None:
+        return b""
+    return str(value).encode("ascii")
+
+# Tekens die in numerieke tekst kunnen voorkomen; is de delimiter er één
+# van, dan mag de quote-scan voor getalkolommen niet overgeslagen worden
+NUMERIC_TEXT_CHARS = "+-.0123456789eE"
+
+# Idem voor de str()-vorm van datums/tijden ("2024-01-02 03:04:05.123456")
+DATETIME_TEXT_CHARS = "-:. 0123456789"
+
+NUMERIC_TYPE_CODES = (int, float, bool, Decimal)
+DATETIME_TYPE_CODES = (datetime.datetime, datetime.date, datetime.time)
+
+def quote_empty(encoder):
+    # Voor één-koloms tabellen: een leeg veld moet als "" geschreven worden
+    # (zoals csv.writer doet), anders is de regel leeg en leest csv.reader
+    # hem als record zonder velden
+    def encode(value) -> bytes:
+        b = encoder(value)
+        return b if b else b'""'
+    return encode
+
+def pick_encoder(type_code, delimiter: str, encode_field):
+    # Dispatch-tabel per kolom: types waarvan str() de delimiter/quote/
+    # newline nooit kan bevatten slaan de quote-scan over
+    if type_code in NUMERIC_TYPE_CODES and delimiter not in NUMERIC_TEXT_CHARS:
+        return plain_field
+    if type_code in DATETIME_TYPE_CODES and delimiter not in DATETIME_TEXT_CHARS:
+        return plain_field
+    return encode_field
+
+def build_row_formatter(description, encode_field, sep: bytes, term: bytes, delimiter: str):
+    # Genereer per tabel een uitgerolde fmt(row)->bytes met per kolom de
+    # encoder uit de dispatch-tabel; encoders en constanten worden als
+    # default-argument gebonden zodat de lus ze via LOAD_FAST vindt
+    namespace = {"_sep": sep, "_term": term}
+    parts = []
+    single_column = len(description) == 1
+    for i, desc in enumerate(description):
+        enc = pick_encoder(desc[1], delimiter, encode_field)
+        if single_column:
+            enc = quote_empty(enc)
+        namespace[f"_e{i}"] = enc
+        parts.append(f"_e{i}(row[{i}])")
+    binds = ", ".join(f"{n}={n}" for n in namespace)
+    src = (
+        f"def fmt(row, {binds}):\n"
+        "    return _sep.join((" + ", ".join(parts) + ",)) + _term\n"
+    )
+    exec(compile(src, "<fmt>", "exec"), namespace)
+    return namespace["fmt"]
+
 def resolve_lineterminator(s: Optional[str]) -> str:
     if not s:
         return os.linesep
     mapping = {"\\n": "\n", "\\r\\n": "\r\n", "\\r": "\r"}
     return mapping.get(s, s)
 
+@functools.lru_cache(maxsize=1)
 def detect_access_driver() -> Optional[str]:
-    # Zoek een geschikte Access-driver
-    drivers = [d for d in pyodbc.drivers()]
+    # Zoek een geschikte Access-driver; gecachet omdat pyodbc.drivers()
+    # de ODBC-drivermanager enumereert en dit per connectie wordt gevraagd
+    drivers = [(d, d.lower()) for d in pyodbc.drivers()]
     # Prefer 64-bit modern driver naam
     for needle in [
-        "Microsoft Access Driver (*.mdb, *.accdb)",
-        "Microsoft Access Driver (*.mdb)"
+        "microsoft access driver (*.mdb, *.accdb)",
+        "microsoft access driver (*.mdb)"
     ]:
-        for d in drivers:
-            if needle.lower() in d.lower():
+        for d, d_lc in drivers:
+            if needle in d_lc:
                 return d
     return None
 
-def connect_via_path(db_path: str) -> pyodbc.Connection:
+def tune_connection(conn: pyodbc.Connection, encoding: str = "utf-8"):
+    # Eén keer de (de)codering instellen voorkomt unicode-conversie per cel.
+    # Uitlijnen op de CSV-doelcodering maakt de round-trip driver -> bestand
+    # een pass-through; bij exotische doelcoderingen blijft het utf-8
+    try:
+        codec = codecs.lookup(encoding).name
+    except LookupError:
+        codec = "utf-8"
+    if codec not in BYTES_SAFE_ENCODINGS:
+        codec = "utf-8"
+    conn.setdecoding(pyodbc.SQL_CHAR, encoding=codec)
+    conn.setdecoding(pyodbc.SQL_WCHAR, encoding="utf-16le")
+    conn.setencoding(encoding=codec)
+
+def path_conn_str(db_path: str) -> str:
     driver = detect_access_driver()
     if not driver:
         print("Kon de Microsoft Access ODBC-driver niet vinden. Installeer Access Database Engine.", file=sys.stderr)
@@ -51,25 +184,35 @@ def connect_via_path(db_path: str) -> pyodbc.Connection:
         print(f"Database niet gevonden: {db_path}", file=sys.stderr)
         sys.exit(2)
     # DBQ wijst naar bestand; met standaard opties
-    conn_str = f'DRIVER={{{driver}}};DBQ={db_path};'
-    try:
-        return pyodbc.connect(conn_str, autocommit=False)
-    except pyodbc.Error as e:
-        print(f"ODBC connectiefout: {e}", file=sys.stderr)
-        sys.exit(3)
+    return f'DRIVER={{{driver}}};DBQ={db_path};'
 
-def connect_via_dsn(dsn: str, uid: Optional[str], pwd: Optional[str]) -> pyodbc.Connection:
+def dsn_conn_str(dsn: str, uid: Optional[str], pwd: Optional[str]) -> str:
     parts = [f"DSN={dsn}"]
     if uid:
         parts.append(f"UID={uid}")
     if pwd:
         parts.append(f"PWD={pwd}")
-    conn_str = ";".join(parts) + ";"
+    return ";".join(parts) + ";"
+
+def connect_via_path(db_path: str, encoding: str = "utf-8") -> pyodbc.Connection:
+    conn_str = path_conn_str(db_path)
+    try:
+        conn = pyodbc.connect(conn_str, autocommit=False)
+    except pyodbc.Error as e:
+        print(f"ODBC connectiefout: {e}", file=sys.stderr)
+        sys.exit(3)
+    tune_connection(conn, encoding)
+    return conn
+
+def connect_via_dsn(dsn: str, uid: Optional[str], pwd: Optional[str], encoding: str = "utf-8") -> pyodbc.Connection:
+    conn_str = dsn_conn_str(dsn, uid, pwd)
     try:
-        return pyodbc.connect(conn_str, autocommit=False)
+        conn = pyodbc.connect(conn_str, autocommit=False)
     except pyodbc.Error as e:
         print(f"ODBC connectiefout (DSN): {e}", file=sys.stderr)
         sys.exit(3)
+    tune_connection(conn, encoding)
+    return conn
 
 def list_objects(conn: pyodbc.Connection, include_views: bool) -> Tuple[List[str], List[str]]:
     # Retourneer (tables, views)
@@ -84,6 +227,278 @@ def list_objects(conn: pyodbc.Connection, include_views: bool) -> Tuple[List[str
                 views.append(row.table_name)
     return (tables, views)
 
+def iouring_supported() -> bool:
+    # liburing geïnstalleerd én Linux-kernel >= 5.10
+    if liburing is None or not sys.platform.startswith("linux"):
+        return False
+    # Nieuwere liburing-releases hernoemden io_uring/io_uring_cqe naar
+    # Ring/CQE; zonder de oude namen valt de writer terug op gebufferd
+    if not hasattr(liburing, "io_uring") or not hasattr(liburing, "io_uring_cqe"):
+        return False
+    release = os.uname().release.split("-")[0].split(".")
+    try:
+        major, minor = int(release[0]), int(release[1])
+    except (ValueError, IndexError):
+        return False
+    return (major, minor) >= (5, 10)
+
+class UringCSVWriter:
+    # Batcht writes in een io_uring submission queue: één submit-syscall
+    # per SUBMIT_EVERY chunks i.p.v. één write() per chunk
+    SUBMIT_EVERY = 16
+
+    def __init__(self, path: str, queue_depth: int = 64):
+        self.fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        self.ring = liburing.io_uring()
+        liburing.io_uring_queue_init(queue_depth, self.ring, 0)
+        self.offset = 0
+        self.pending = 0
+        self.inflight: List[bytes] = []  # buffers levend houden tot completion
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        liburing.io_uring_prep_write(sqe, self.fd, chunk, len(chunk), self.offset)
+        self.offset += len(chunk)
+        self.inflight.append(chunk)
+        self.pending += 1
+        if self.pending >= self.SUBMIT_EVERY:
+            self.flush()
+        return len(chunk)
+
+    def flush(self):
+        # Submit alles wat klaarstaat en wacht de completions af
+        if not self.pending:
+            return
+        liburing.io_uring_submit(self.ring)
+        cqe = liburing.io_uring_cqe()
+        for _ in range(self.pending):
+            liburing.io_uring_wait_cqe(self.ring, cqe)
+            liburing.trap_error(cqe.res)
+            liburing.io_uring_cqe_seen(self.ring, cqe)
+        self.pending = 0
+        self.inflight.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        liburing.io_uring_queue_exit(self.ring)
+        os.close(self.fd)
+        return False
+
+class MmapWriter:
+    # Schrijft sequentieel in een voorgealloceerd mmap-venster; fallocate
+    # geeft het bestand vooraf een aaneengesloten regio, bij sluiten wordt
+    # teruggeknipt naar de werkelijke lengte
+    def __init__(self, path: str, size: int):
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC)
+        self.size = max(size, mmap.PAGESIZE)
+        self._allocate(self.size)
+        self.mm = mmap.mmap(self.fd, self.size)
+        self.pos = 0
+
+    def _allocate(self, size: int):
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(self.fd, 0, size)
+        else:
+            # Windows: geen posix_fallocate; truncate reserveert de lengte
+            os.ftruncate(self.fd, size)
+
+    def write(self, data) -> int:
+        n = len(data)
+        end = self.pos + n
+        if end > self.size:
+            # Verdubbelen tot het past; mmap.resize volgt het bestand
+            new_size = self.size
+            while new_size < end:
+                new_size *= 2
+            self._allocate(new_size)
+            self.mm.resize(new_size)
+            self.size = new_size
+        self.mm[self.pos:end] = data
+        self.pos = end
+        return n
+
+    def flush(self):
+        self.mm.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.mm.close()
+        os.ftruncate(self.fd, self.pos)
+        os.close(self.fd)
+        return False
+
+def iter_batches(cursor, batch_size: int, counter: List[int]):
+    # Generator over alle batches; writer.writerows consumeert hem volledig
+    # in C, dus de per-rij stap blijft buiten de Python-bytecode-lus
+    while (rows := cursor.fetchmany(batch_size)):
+        counter[0] += len(rows)
+        yield from rows
+
+def estimate_row_bytes(description) -> int:
+    # Grove schatting van de rijbreedte uit de kolomgroottes van de driver
+    # (internal_size, bv. VARCHAR(n) -> n); gebruikt om buffers en
+    # preallocatie te dimensioneren, hoeft dus niet precies te zijn
+    est = 0
+    for desc in description:
+        internal = desc[3]
+        if isinstance(internal, int) and 0 < internal <= 1 << 20:
+            est += internal
+        else:
+            est += 16
+        est += 1  # delimiter/regeleinde
+    return max(est, 8)
+
+# numpy-dtype kinds die zonder quoting als getal geschreven kunnen worden
+NUMERIC_DTYPE_KINDS = "iuf"
+
+def export_table_turbodbc(conn_str: str,
+                          name: str,
+                          out_dir: str,
+                          delimiter: str,
+                          encoding: str,
+                          lineterminator: str) -> Optional[Tuple[str, int]]:
+    # Kolomgeoriënteerd pad: turbodbc.fetchnumpybatches levert de tabel
+    # batchgewijs als numpy-arrays, zonder Python-object per cel. Alleen
+    # voor volledig numerieke tabellen zonder NULLs; anders None, dan
+    # neemt het pyodbc-pad het over (dat het bestand opnieuw aanmaakt).
+    tconn = turbodbc.connect(connection_string=conn_str)
+    try:
+        cursor = tconn.cursor()
+        cursor.execute(f"SELECT * FROM [{name}]")
+        # Verwerp niet-numerieke tabellen op de metadata, vóór er ook maar
+        # één rij gematerialiseerd is
+        if any(desc[1] != turbodbc.NUMBER for desc in cursor.description):
+            return None
+        columns = [desc[0] for desc in cursor.description]
+
+        safe = sanitize_filename(name)
+        out_path = os.path.join(out_dir, f"{safe}.csv")
+        # Zelfde quoting voor de kopregel als de andere paden
+        encode_field = make_field_encoder(delimiter, encoding)
+        if len(columns) == 1:
+            encode_field = quote_empty(encode_field)
+        header = delimiter.join(encode_field(c).decode(encoding) for c in columns)
+        total = 0
+        with open(out_path, "w", encoding=encoding, newline="") as f:
+            f.write(header + lineterminator)
+            for batch in cursor.fetchnumpybatches():
+                arrays = list(batch.values())
+                if not arrays or len(arrays[0]) == 0:
+                    continue
+                for a in arrays:
+                    # NULLs (maskers) kunnen pas per batch blijken
+                    if a.dtype.kind not in NUMERIC_DTYPE_KINDS or numpy.ma.is_masked(a):
+                        return None
+                fmts = ["%d" if a.dtype.kind in "iu" else "%.17g" for a in arrays]
+                data = numpy.column_stack([numpy.ma.getdata(a) for a in arrays])
+                numpy.savetxt(f, data, fmt=fmts, delimiter=delimiter, newline=lineterminator)
+                total += data.shape[0]
+        return out_path, total
+    finally:
+        tconn.close()
+
+def export_table_into(conn: pyodbc.Connection,
+                      name: str,
+                      f,
+                      delimiter: str,
+                      encoding: str,
+                      lineterminator: str,
+                      batch_size: int,
+                      fast: bool,
+                      banner: bool = False,
+                      row_estimate: int = 0) -> int:
+    # Schrijft één tabel (bytes-pad) in een al geopende binaire writer;
+    # met banner=True krijgt de tabel een "# TABLE:"-kopregel (--concat)
+    cursor = conn.cursor()
+    # arraysize laat de driver grotere ODBC-chunks prefetchen
+    cursor.arraysize = batch_size
+
+    # Eén execute volstaat: description levert de kolomnamen,
+    # dus geen aparte "WHERE 1=0"-probe per tabel
+    cursor.execute(f"SELECT * FROM [{name}]")
+    columns = [desc[0] for desc in cursor.description]
+    est_row_bytes = estimate_row_bytes(cursor.description)
+
+    # Met een rijtelling vooraf kan het bestand aaneengesloten gereserveerd
+    # worden; na afloop wordt teruggeknipt naar de werkelijke lengte
+    trim = False
+    if row_estimate and hasattr(f, "fileno") and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, row_estimate * est_row_bytes)
+            trim = True
+        except OSError:
+            pass
+
+    encode_field = make_field_encoder(delimiter, encoding)
+    sep = delimiter.encode(encoding)
+    term = lineterminator.encode(encoding)
+    if banner:
+        f.write(f"# TABLE: {name}".encode(encoding) + term)
+    header_encode = quote_empty(encode_field) if len(columns) == 1 else encode_field
+    f.write(sep.join(header_encode(c) for c in columns) + term)
+
+    total = 0
+    if fast and _csvfast is not None:
+        # C-extensie formatteert de hele batch in één aanroep
+        while (rows := cursor.fetchmany(batch_size)):
+            f.write(_csvfast.rows_to_csv_bytes(rows, sep, term, encoding))
+            total += len(rows)
+    else:
+        # Per tabel gespecialiseerde formatter: kolomtypes zijn na
+        # execute bekend, dus de typekeuze gebeurt één keer i.p.v. per cel
+        fmt = build_row_formatter(cursor.description, encode_field, sep, term, delimiter)
+        # Eén voorgedimensioneerde buffer met schrijfpositie: de capaciteit
+        # blijft tussen batches staan (bytearray.clear() zou die vrijgeven),
+        # dus na de eerste batch zijn er geen reallocs meer
+        buf = bytearray(min(max(batch_size * est_row_bytes, 1 << 16), 64 << 20))
+        while (rows := cursor.fetchmany(batch_size)):
+            pos = 0
+            for row in rows:
+                line = fmt(row)
+                end = pos + len(line)
+                if end > len(buf):
+                    buf.extend(bytes(end - len(buf) + (len(buf) >> 1)))
+                buf[pos:end] = line
+                pos = end
+            f.write(memoryview(buf)[:pos])
+            total += len(rows)
+    if trim:
+        f.flush()
+        os.ftruncate(f.fileno(), f.tell())
+    return total
+
+def count_rows(names: List[str], conn_factory, jobs: int) -> dict:
+    # Tel rijen per tabel, verdeeld over workers met elk een eigen
+    # connectie (Jet/ACE is niet thread-safe per connectie); tabellen die
+    # niet telbaar zijn krijgen 0 en komen dus achteraan
+    def count_slice(sub: List[str]) -> List[Tuple[str, int]]:
+        conn = conn_factory()
+        try:
+            cursor = conn.cursor()
+            out = []
+            for n in sub:
+                try:
+                    cursor.execute(f"SELECT COUNT(*) FROM [{n}]")
+                    out.append((n, cursor.fetchone()[0] or 0))
+                except pyodbc.Error:
+                    out.append((n, 0))
+            return out
+        finally:
+            conn.close()
+
+    slices = [names[i::jobs] for i in range(jobs) if names[i::jobs]]
+    counts: dict = {}
+    with ThreadPoolExecutor(max_workers=len(slices)) as ex:
+        for result in ex.map(count_slice, slices):
+            counts.update(result)
+    return counts
+
 def export_table(conn: pyodbc.Connection,
                  name: str,
                  out_dir: str,
@@ -91,41 +506,74 @@ def export_table(conn: pyodbc.Connection,
                  encoding: str,
                  lineterminator: str,
                  batch_size: int,
-                 quiet: bool) -> Tuple[str, int]:
+                 write_buffer: int,
+                 fast: bool,
+                 preallocate: int,
+                 iouring: bool,
+                 quiet: bool,
+                 row_estimate: Optional[int] = None) -> Tuple[str, int]:
     safe = sanitize_filename(name)
     out_path = os.path.join(out_dir, f"{safe}.csv")
 
-    # Query met expliciete kolomnamen voor nette header volgorde
-    cursor = conn.cursor()
+    # Open writer; de uitvoermap is al door main() aangemaakt
     try:
-        # Haal kolomnamen op
-        col_cursor = conn.cursor()
-        col_cursor.execute(f"SELECT * FROM [{name}] WHERE 1=0")
-        columns = [desc[0] for desc in col_cursor.description]
-    except pyodbc.Error:
-        # Fallback: direct SELECT * en pak description van cursor
-        cursor.execute(f"SELECT * FROM [{name}] WHERE 1=0")
-        columns = [desc[0] for desc in cursor.description]
+        if bytes_path_supported(delimiter, encoding):
+            # Bytes-pad: velden één keer encoden en rauw wegschrijven,
+            # zonder TextIOWrapper/codec-machinerie per write
+            # Rijtelling vooraf (goedkoop; Access gebruikt de index) zodat
+            # het bestand in één keer gereserveerd kan worden. Serieel op
+            # dezelfde connectie: Jet/ACE is niet thread-safe per connectie.
+            # Een al bekende telling (uit de --jobs-sortering) wordt
+            # hergebruikt, dan is er geen tweede COUNT(*) per tabel
+            if row_estimate is None:
+                row_estimate = 0
+                if preallocate == 0 and not iouring:
+                    try:
+                        count_cursor = conn.cursor()
+                        count_cursor.execute(f"SELECT COUNT(*) FROM [{name}]")
+                        row_estimate = count_cursor.fetchone()[0] or 0
+                    except pyodbc.Error:
+                        row_estimate = 0
+            if preallocate > 0:
+                sink = MmapWriter(out_path, preallocate)
+            elif iouring and iouring_supported():
+                sink = UringCSVWriter(out_path)
+            else:
+                sink = open(out_path, "wb", buffering=write_buffer)
+            with sink as f:
+                total = export_table_into(
+                    conn=conn,
+                    name=name,
+                    f=f,
+                    delimiter=delimiter,
+                    encoding=encoding,
+                    lineterminator=lineterminator,
+                    batch_size=batch_size,
+                    fast=fast,
+                    row_estimate=row_estimate,
+                )
+                f.flush()
+            return out_path, total
 
-    # Open writer
-    try:
-        os.makedirs(out_dir, exist_ok=True)
+        # Fallback voor niet-triviale delimiter/codering (bv. UTF-16)
         newline_arg = ""  # verplicht voor csv-module in py3
-        with open(out_path, "w", encoding=encoding, newline=newline_arg) as f:
+        # Grote schrijfbuffer: minder write()-syscalls dan de standaard 8 KiB
+        with open(out_path, "w", encoding=encoding, newline=newline_arg, buffering=write_buffer) as f:
+            cursor = conn.cursor()
+            # arraysize laat de driver grotere ODBC-chunks prefetchen
+            cursor.arraysize = batch_size
+            cursor.execute(f"SELECT * FROM [{name}]")
+            columns = [desc[0] for desc in cursor.description]
+
             writer = csv.writer(f, delimiter=delimiter, quoting=csv.QUOTE_MINIMAL, lineterminator=lineterminator)
             writer.writerow(columns)
 
-            # Lees in batches
-            cursor.execute(f"SELECT * FROM [{name}]")
-            total = 0
-            while True:
-                rows = cursor.fetchmany(batch_size)
-                if not rows:
-                    break
-                for row in rows:
-                    # pyodbc row -> tuple
-                    writer.writerow(tuple(row))
-                total += len(rows)
+            # Eén writerows-aanroep over alle batches: fetch/format/write
+            # draait als één pijplijn in C, het tellen zit in de generator
+            counted = [0]
+            writer.writerows(iter_batches(cursor, batch_size, counted))
+            total = counted[0]
+            f.flush()
         return out_path, total
     except (OSError, IOError) as e:
         print(f"Schrijffout voor {out_path}: {e}", file=sys.stderr)
@@ -146,6 +594,14 @@ def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
     p.add_argument("-e", "--encoding", default="utf-8", help="Tekencodering (default: utf-8)")
     p.add_argument("--lineterm", default=None, help="Regelscheiding, bv. \\n of \\r\\n (default: systeem)")
     p.add_argument("--batch-size", type=int, default=10000, help="Rijen per fetch (default: 10000)")
+    p.add_argument("--write-buffer", type=int, default=1 << 20, help="Schrijfbuffer in bytes (default: 1 MiB)")
+    p.add_argument("-j", "--jobs", type=int, default=1, help="Tabellen parallel exporteren met N workers (Access/ACE: max 4 is veilig)")
+    p.add_argument("--fast", action="store_true", help="Gebruik de gecompileerde _csvfast-extensie indien gebouwd")
+    p.add_argument("--preallocate", type=int, default=0, help="Prealloceer per CSV dit aantal bytes en schrijf via mmap (0 = uit)")
+    p.add_argument("--iouring", action="store_true", help="Schrijf via io_uring (Linux >= 5.10, vereist pip install liburing)")
+    p.add_argument("--concat", metavar="FILE", help="Schrijf alle tabellen naar één bestand met '# TABLE:'-kopregels")
+    p.add_argument("--turbodbc", action="store_true", help="Numerieke tabellen kolomsgewijs exporteren via turbodbc/numpy")
+    p.add_argument("--no-sort", action="store_true", help="Bij --jobs niet op tabelgrootte sorteren (grootste eerst)")
     p.add_argument("--dsn", help="Gebruik ODBC-DSN i.p.v. pad")
     p.add_argument("--uid", help="Gebruikersnaam voor DSN")
     p.add_argument("--pwd", help="Wachtwoord voor DSN")
@@ -165,16 +621,43 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
     delim = "\t" if args.delimiter == "\\t" else args.delimiter
     lineterm = resolve_lineterminator(args.lineterm)
 
+    if args.fast and _csvfast is None:
+        print("Waarschuwing: _csvfast is niet gebouwd; --fast valt terug op het Python-pad.", file=sys.stderr)
+
+    if args.iouring and not iouring_supported():
+        print("Waarschuwing: io_uring niet beschikbaar; er wordt gebufferd geschreven.", file=sys.stderr)
+
+    if args.turbodbc and turbodbc is None:
+        print("Waarschuwing: turbodbc/numpy niet geïnstalleerd; pyodbc-pad wordt gebruikt.", file=sys.stderr)
+
+    if args.concat and not bytes_path_supported(delim, args.encoding):
+        print("--concat vereist een ASCII-compatibele codering en een delimiter van één teken.", file=sys.stderr)
+        return 2
+
+    # Start de connect op een achtergrondthread; pyodbc laat de GIL los
+    # tijdens SQLDriverConnect, dus mapaanmaak overlapt met de (trage) connect
+    connect_pool = ThreadPoolExecutor(max_workers=1)
     if args.dsn:
-        conn = connect_via_dsn(args.dsn, args.uid, args.pwd)
+        conn_future = connect_pool.submit(connect_via_dsn, args.dsn, args.uid, args.pwd, args.encoding)
         db_label = f"DSN={args.dsn}"
     else:
         if not args.db_path:
+            connect_pool.shutdown(wait=False)
             print("Geef een pad naar de database of gebruik --dsn.", file=sys.stderr)
             return 2
-        conn = connect_via_path(args.db_path)
+        conn_future = connect_pool.submit(connect_via_path, args.db_path, args.encoding)
         db_label = args.db_path
 
+    if not args.dry_run:
+        if args.concat:
+            parent = os.path.dirname(args.concat)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+        else:
+            os.makedirs(args.out, exist_ok=True)
+    conn = conn_future.result()
+    connect_pool.shutdown()
+
     try:
         tables, views = list_objects(conn, include_views=args.include_views)
     except pyodbc.Error as e:
@@ -206,23 +689,108 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
 
     log(f"Verbonden met: {db_label}", args.quiet)
     log(f"Te exporteren objecten: {len(selected)}", args.quiet)
-    os.makedirs(args.out, exist_ok=True)
 
-    total_rows = 0
-    for name in selected:
-        log(f"- Export [{name}] ...", args.quiet)
-        out_path, count = export_table(
-            conn=conn,
+    def open_conn() -> pyodbc.Connection:
+        if args.dsn:
+            return connect_via_dsn(args.dsn, args.uid, args.pwd, args.encoding)
+        return connect_via_path(args.db_path, args.encoding)
+
+    turbo_conn_str = None
+    if args.turbodbc and turbodbc is not None:
+        turbo_conn_str = dsn_conn_str(args.dsn, args.uid, args.pwd) if args.dsn else path_conn_str(args.db_path)
+
+    # Gevuld door de --jobs-sortering; export_table hergebruikt de telling
+    table_counts: dict = {}
+
+    def export_one(name: str, worker_conn: pyodbc.Connection) -> Tuple[str, int]:
+        if turbo_conn_str:
+            # Probeer eerst kolomsgewijs; niet-numerieke tabellen vallen
+            # terug op het rij-georiënteerde pyodbc-pad
+            try:
+                result = export_table_turbodbc(turbo_conn_str, name, args.out, delim, args.encoding, lineterm)
+            except (turbodbc.DatabaseError, turbodbc.InterfaceError) as e:
+                log(f"  turbodbc faalde voor [{name}] ({e}); pyodbc-pad", args.quiet)
+                result = None
+            if result is not None:
+                return result
+        return export_table(
+            conn=worker_conn,
             name=name,
             out_dir=args.out,
             delimiter=delim,
             encoding=args.encoding,
             lineterminator=lineterm,
             batch_size=args.batch_size,
+            write_buffer=args.write_buffer,
+            fast=args.fast,
+            preallocate=args.preallocate,
+            iouring=args.iouring,
             quiet=args.quiet,
+            row_estimate=table_counts.get(name),
         )
-        total_rows += count
-        log(f"  -> {out_path} ({count} rijen)", args.quiet)
+
+    if args.concat:
+        # Eén bestand, dus ook één open/close: scheelt per-bestand overhead
+        # bij databases met duizenden kleine tabellen; schrijven is serieel
+        if args.jobs > 1:
+            print("Waarschuwing: --concat schrijft serieel; --jobs wordt genegeerd.", file=sys.stderr)
+        total_rows = 0
+        try:
+            with open(args.concat, "wb", buffering=args.write_buffer) as f:
+                for name in selected:
+                    log(f"- Export [{name}] ...", args.quiet)
+                    count = export_table_into(
+                        conn=conn,
+                        name=name,
+                        f=f,
+                        delimiter=delim,
+                        encoding=args.encoding,
+                        lineterminator=lineterm,
+                        batch_size=args.batch_size,
+                        fast=args.fast,
+                        banner=True,
+                    )
+                    total_rows += count
+                    log(f"  -> {args.concat} (+{count} rijen)", args.quiet)
+                f.flush()
+        except (OSError, IOError) as e:
+            print(f"Schrijffout voor {args.concat}: {e}", file=sys.stderr)
+            return 5
+        except pyodbc.Error as e:
+            print(f"Leesfout: {e}", file=sys.stderr)
+            return 3
+        log(f"Klaar. 1 bestand geschreven, totaal {total_rows} rijen.", args.quiet)
+        return 0
+
+    if args.jobs > 1 and not args.no_sort and len(selected) > 1:
+        # LPT-planning: grootste tabellen eerst, anders hangt aan het eind
+        # één worker nog alleen aan een grote tabel terwijl de rest klaar is
+        table_counts.update(count_rows(selected, open_conn, args.jobs))
+        selected.sort(key=lambda t: table_counts.get(t, 0), reverse=True)
+
+    total_rows = 0
+    if args.jobs > 1:
+        # Jet/ACE is niet thread-safe op één connectie: elke worker een eigen
+        def export_with_own_conn(name: str) -> Tuple[str, int]:
+            wconn = open_conn()
+            try:
+                return export_one(name, wconn)
+            finally:
+                wconn.close()
+
+        with ThreadPoolExecutor(max_workers=args.jobs) as ex:
+            futures = {ex.submit(export_with_own_conn, t): t for t in selected}
+            for fut in as_completed(futures):
+                name = futures[fut]
+                out_path, count = fut.result()
+                total_rows += count
+                log(f"- Export [{name}] -> {out_path} ({count} rijen)", args.quiet)
+    else:
+        for name in selected:
+            log(f"- Export [{name}] ...", args.quiet)
+            out_path, count = export_one(name, conn)
+            total_rows += count
+            log(f"  -> {out_path} ({count} rijen)", args.quiet)
 
     log(f"Klaar. {len(selected)} bestanden geschreven, totaal {total_rows} rijen.", args.quiet)
     return 0